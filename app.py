@@ -1,16 +1,20 @@
 """
 LinkedIn Researcher - Flask web application
 """
+import io
 import os
-import json
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for, abort
+import redis
+from celery import Celery
+from flask import Flask, render_template, request, redirect, url_for, abort
+from sqlalchemy import text
 from markupsafe import Markup
-import markdown
+import orjson
 
 from db import db, init_db
 from models import ResearchQuery, ResearchStep, LinkedInProfile, Insight
@@ -21,32 +25,120 @@ from linkedin_api import linkedin_api
 app = Flask(__name__)
 app.secret_key = os.environ.get("SESSION_SECRET", "linkedin-researcher-secret-key")
 
+# Batch INSERT...VALUES round-trips on psycopg2 so bulk writes in
+# run_research_task go out as multi-row VALUES clauses, and keep a warm
+# validated connection pool so requests don't pay reconnect latency
+if os.environ.get("DATABASE_URL", "").startswith("postgres"):
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "executemany_mode": "values_plus_batch",
+        "executemany_values_page_size": 1000,
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+        "pool_recycle": 3600
+    }
+
 # Initialize database
 init_db(app)
 
+# Celery worker for long-running research tasks; run with
+# `celery -A app.celery worker`
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+celery = Celery(app.name, broker=REDIS_URL)
+
+# Live task status lives in Redis so the worker doesn't need a DB commit
+# (and its WAL fsync) just to make "in_progress" visible to pollers
+_status_store = redis.Redis.from_url(REDIS_URL)
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Single Markdown instance so extension loading and regex compilation
+# happen once per process; the markdown package itself is imported
+# lazily because it is only needed once a results page renders
+_MD = None
+
+
+@lru_cache(maxsize=256)
+def _render_markdown_cached(text: str) -> str:
+    """Render markdown to HTML, memoized because research summaries are
+    re-rendered on every poll of the results page"""
+    global _MD
+    if _MD is None:
+        import markdown
+        _MD = markdown.Markdown(extensions=["extra"], output_format="html5")
+    _MD.reset()
+    return _MD.convert(text)
+
+
 # Markdown filter for templates
 @app.template_filter('markdown')
 def render_markdown(text):
-    return Markup(markdown.markdown(text))
+    return Markup(_render_markdown_cached(text))
+
+
+# API key status for UI display; env vars cannot change after process
+# start, so this is computed once at import time
+API_KEYS = {
+    "openai": bool(os.environ.get("OPENAI_API_KEY")),
+    "rapidapi": bool(os.environ.get("RAPIDAPI_KEY")),
+    "linkedin": bool(os.environ.get("LINKEDIN_EMAIL") and os.environ.get("LINKEDIN_PASSWORD"))
+}
 
 
 # Helper functions
 def get_api_keys() -> Dict[str, bool]:
     """
     Get API key status for UI display
-    
+
     Returns:
         Dictionary of API key statuses
     """
-    return {
-        "openai": bool(os.environ.get("OPENAI_API_KEY")),
-        "rapidapi": bool(os.environ.get("RAPIDAPI_KEY")),
-        "linkedin": bool(os.environ.get("LINKEDIN_EMAIL") and os.environ.get("LINKEDIN_PASSWORD"))
-    }
+    return API_KEYS
+
+
+@lru_cache(maxsize=1024)
+def parse_expertise(raw: Optional[str]) -> tuple:
+    """
+    Parse a stored expertise JSON string into a tuple of skills
+
+    The status API is polled repeatedly while the same rows keep coming
+    back unchanged, so parsing is cached per raw column value.
+
+    Args:
+        raw: JSON-encoded expertise column value
+
+    Returns:
+        Tuple of expertise strings (empty if missing or malformed)
+    """
+    if not raw:
+        return ()
+    try:
+        return tuple(orjson.loads(raw))
+    except Exception:
+        return ()
+
+
+def load_research(research_id: int) -> Tuple[Optional[ResearchQuery], List[LinkedInProfile], List[ResearchStep], List[Insight]]:
+    """
+    Load a research record together with its profiles, steps and insights
+
+    Args:
+        research_id: Research task ID
+
+    Returns:
+        Tuple of (research, profiles, steps, insights); research is None if not found
+    """
+    research = db.session.get(ResearchQuery, research_id)
+    if not research:
+        return None, [], [], []
+
+    profiles = db.session.query(LinkedInProfile).filter_by(research_id=research_id).all()
+    steps = db.session.query(ResearchStep).filter_by(research_id=research_id).all()
+    insights = db.session.query(Insight).filter_by(research_id=research_id).all()
+
+    return research, profiles, steps, insights
 
 
 def start_research_task(query: str) -> int:
@@ -70,10 +162,119 @@ def start_research_task(query: str) -> int:
     return research.id
 
 
-async def run_research_task(research_id: int) -> None:
+def publish_live_status(research_id: int, status: str) -> None:
     """
-    Run a research task asynchronously
-    
+    Publish a transient task status to Redis
+
+    Args:
+        research_id: Research task ID
+        status: Status value to publish
+    """
+    try:
+        _status_store.setex(f"research:{research_id}:status", 3600, status)
+    except Exception as e:
+        logger.warning(f"Could not publish live status: {str(e)}")
+
+
+def get_live_status(research_id: int) -> Optional[str]:
+    """
+    Read a transient task status from Redis
+
+    Args:
+        research_id: Research task ID
+
+    Returns:
+        Published status or None if unavailable
+    """
+    try:
+        value = _status_store.get(f"research:{research_id}:status")
+        return value.decode() if value else None
+    except Exception:
+        return None
+
+
+# Row counts above this bypass INSERT...VALUES in favor of Postgres COPY
+COPY_THRESHOLD = 50
+
+
+def _copy_rows(model, rows: List[Dict[str, Any]]) -> None:
+    """
+    Bulk-load rows into a model's table with Postgres COPY FROM STDIN
+
+    Args:
+        model: Mapped model class
+        rows: Row dicts sharing the same keys
+    """
+    columns = list(rows[0])
+    buf = io.StringIO()
+    for row in rows:
+        fields = []
+        for column in columns:
+            value = row[column]
+            if value is None:
+                fields.append("\\N")
+            else:
+                fields.append(
+                    str(value)
+                    .replace("\\", "\\\\")
+                    .replace("\t", "\\t")
+                    .replace("\n", "\\n")
+                    .replace("\r", "\\r")
+                )
+        buf.write("\t".join(fields) + "\n")
+    buf.seek(0)
+
+    cursor = db.session.connection().connection.cursor()
+    cursor.copy_from(buf, model.__tablename__, columns=columns)
+
+
+def _insert_rows(model, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert rows for a model, choosing COPY or executemany by volume
+
+    Args:
+        model: Mapped model class
+        rows: Row dicts sharing the same keys
+    """
+    if not rows:
+        return
+
+    if db.engine.dialect.name == "postgresql" and len(rows) > COPY_THRESHOLD:
+        _copy_rows(model, rows)
+    else:
+        db.session.bulk_insert_mappings(model, rows)
+
+
+# One long-lived event loop per worker process; asyncio.run would close
+# its loop after every task, leaving the async clients' pooled
+# connections bound to a dead loop and failing all subsequent tasks
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide event loop used for research tasks"""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+    return _worker_loop
+
+
+@celery.task
+def run_research_task(research_id: int) -> None:
+    """
+    Run a research task on a Celery worker
+
+    Args:
+        research_id: Research task ID
+    """
+    with app.app_context():
+        _run_research_task(research_id)
+
+
+def _run_research_task(research_id: int) -> None:
+    """
+    Execute a research task and persist its results
+
     Args:
         research_id: Research task ID
     """
@@ -83,15 +284,25 @@ async def run_research_task(research_id: int) -> None:
         if not research:
             logger.error(f"Research not found: {research_id}")
             return
-            
-        # Update status
-        research.status = "in_progress"
-        db.session.commit()
-        
-        # Run research
         query = research.query
-        results = await research_linkedin(query)
-        
+
+        # Publish the transient status via Redis instead of paying a DB
+        # commit just for the intermediate "in_progress" marker, and
+        # release the session's connection so it doesn't sit
+        # idle-in-transaction for the whole multi-minute research call
+        publish_live_status(research_id, "in_progress")
+        db.session.close()
+
+        # Run research on the worker's persistent loop so the agent's
+        # HTTP connection pools stay usable across tasks
+        results = _get_worker_loop().run_until_complete(research_linkedin(query))
+
+        # Re-fetch the row on a fresh transaction for the result writes
+        research = db.session.get(ResearchQuery, research_id)
+        if not research:
+            logger.error(f"Research not found: {research_id}")
+            return
+
         # Process results
         if "error" in results:
             research.status = "failed"
@@ -104,55 +315,68 @@ async def run_research_task(research_id: int) -> None:
         research.summary = results.get("summary", "")
         research.updated_at = datetime.now()
         
-        # Save steps
+        # Save steps, profiles and insights as plain row dicts so each table
+        # gets a single executemany INSERT instead of one round-trip per row
+        step_rows = []
         for step_data in results.get("steps", []):
-            step = ResearchStep()
-            step.research_id = research.id
-            step.type = step_data.get("type", "analysis")
-            step.description = step_data.get("description", "")
-            step.reasoning = step_data.get("reasoning", "")
-            step.status = step_data.get("status", "completed")
-            step.confidence = step_data.get("confidence")
-            step.duration = step_data.get("duration")
-            
-            if step_data.get("result") is not None:
-                if isinstance(step_data["result"], (dict, list)):
-                    step.result = json.dumps(step_data["result"])
+            result = step_data.get("result")
+            if result is not None:
+                if isinstance(result, (dict, list)):
+                    result = orjson.dumps(result).decode()
                 else:
-                    step.result = str(step_data["result"])
-                    
-            db.session.add(step)
-        
-        # Save profiles
-        for profile_data in results.get("profiles", []):
-            profile = LinkedInProfile()
-            profile.research_id = research.id
-            profile.name = profile_data.get("name", "")
-            profile.title = profile_data.get("title", "")
-            profile.company = profile_data.get("company", "")
-            profile.location = profile_data.get("location", "")
-            profile.linkedin_url = profile_data.get("linkedin_url", "")
-            profile.image_url = profile_data.get("image_url", "")
-            
-            if "expertise" in profile_data and profile_data["expertise"]:
-                profile.expertise = json.dumps(profile_data["expertise"])
-                
-            db.session.add(profile)
-        
-        # Save insights
-        for insight in results.get("insights", []):
-            insight_record = Insight()
-            insight_record.research_id = research.id
-            insight_record.text = insight
-            db.session.add(insight_record)
-            
-        # Commit all changes
+                    result = str(result)
+
+            step_rows.append({
+                "research_id": research.id,
+                "type": step_data.get("type", "analysis"),
+                "description": step_data.get("description", ""),
+                "reasoning": step_data.get("reasoning", ""),
+                "status": step_data.get("status", "completed"),
+                "confidence": step_data.get("confidence"),
+                "duration": step_data.get("duration"),
+                "result": result
+            })
+
+        profile_rows = [
+            {
+                "research_id": research.id,
+                "name": profile_data.get("name", ""),
+                "title": profile_data.get("title", ""),
+                "company": profile_data.get("company", ""),
+                "location": profile_data.get("location", ""),
+                "linkedin_url": profile_data.get("linkedin_url", ""),
+                "image_url": profile_data.get("image_url", ""),
+                "expertise": orjson.dumps(profile_data["expertise"]).decode() if profile_data.get("expertise") else None
+            }
+            for profile_data in results.get("profiles", [])
+        ]
+
+        insight_rows = [
+            {"research_id": research.id, "text": insight}
+            for insight in results.get("insights", [])
+        ]
+
+        # Research writes are rerunnable, so skip the WAL flush wait for
+        # this ingest transaction on Postgres
+        if db.engine.dialect.name == "postgresql":
+            db.session.execute(text("SET LOCAL synchronous_commit TO off"))
+
+        # Empty tables are skipped (common when RapidAPI calls fail);
+        # large runs switch to COPY, smaller ones use executemany
+        _insert_rows(ResearchStep, step_rows)
+        _insert_rows(LinkedInProfile, profile_rows)
+        _insert_rows(Insight, insight_rows)
+
+        # Commit all changes (including the status update) in one transaction
         db.session.commit()
         logger.info(f"Research completed: {research_id}")
             
     except Exception as e:
         logger.error(f"Error running research task: {str(e)}")
         try:
+            # A failure mid-save leaves the session in pending-rollback
+            # state; clear it so the row can still be marked failed
+            db.session.rollback()
             research = db.session.get(ResearchQuery, research_id)
             if research:
                 research.status = "failed"
@@ -178,9 +402,10 @@ def research():
         if query:
             # Start the research task
             research_id = start_research_task(query)
-            
-            # Run the task in the background
-            asyncio.create_task(run_research_task(research_id))
+
+            # Hand the task to the Celery worker so the request returns
+            # immediately and Flask workers stay free for pollers
+            run_research_task.delay(research_id)
             
             # Redirect to research results page
             return redirect(url_for('research_results', research_id=research_id))
@@ -193,15 +418,11 @@ def research():
 @app.route('/research/<int:research_id>')
 def research_results(research_id):
     """Research results page"""
-    research = db.session.get(ResearchQuery, research_id)
-    
+    research, profiles, steps, insights = load_research(research_id)
+
     if not research:
         abort(404)
-        
-    profiles = db.session.query(LinkedInProfile).filter_by(research_id=research_id).all()
-    steps = db.session.query(ResearchStep).filter_by(research_id=research_id).all()
-    insights = db.session.query(Insight).filter_by(research_id=research_id).all()
-    
+
     return render_template(
         "research_results.html",
         research=research,
@@ -211,53 +432,118 @@ def research_results(research_id):
     )
 
 
+# Rows per page on the saved-research listing
+SAVED_RESEARCH_PER_PAGE = 50
+
+
 @app.route('/saved-research')
 def saved_research():
     """Saved research page"""
-    research_items = db.session.query(ResearchQuery).order_by(ResearchQuery.created_at.desc()).all()
-    return render_template("saved_research.html", research_items=research_items)
+    # Page through history instead of materializing every row ever saved;
+    # query only the columns the listing renders so the large summary
+    # text never leaves the database
+    page = max(request.args.get('page', 1, type=int), 1)
+    research_items = (
+        db.session.query(
+            ResearchQuery.id, ResearchQuery.query,
+            ResearchQuery.status, ResearchQuery.created_at
+        )
+        .order_by(ResearchQuery.created_at.desc())
+        .limit(SAVED_RESEARCH_PER_PAGE)
+        .offset((page - 1) * SAVED_RESEARCH_PER_PAGE)
+        .all()
+    )
+    return render_template("saved_research.html", research_items=research_items, page=page)
 
 
 @app.route('/api/research/<int:research_id>')
 def api_research_status(research_id):
     """API endpoint for research status"""
     research = db.session.get(ResearchQuery, research_id)
-    
+
     if not research:
         abort(404)
-    
-    # Get related data
-    profiles = db.session.query(LinkedInProfile).filter_by(research_id=research_id).all()
-    steps = db.session.query(ResearchStep).filter_by(research_id=research_id).all()
-    insights = db.session.query(Insight).filter_by(research_id=research_id).all()
-    
+
+    # The DB row stays "pending" until the worker's final commit, so fall
+    # back to the live status the worker publishes through Redis
+    status = research.status
+    if status == "pending":
+        status = get_live_status(research_id) or status
+
+    # Once the task settles, the payload never changes; answer repeat
+    # polls with 304 before touching the child tables or serializing
+    etag = f"{status}:{research.updated_at.timestamp() if research.updated_at else 0}"
+    if etag in request.if_none_match:
+        return "", 304
+
+    # Query plain column tuples instead of hydrating ORM objects just to
+    # call to_dict() on them — this endpoint is polled continuously
+    profile_rows = db.session.query(
+        LinkedInProfile.id, LinkedInProfile.name, LinkedInProfile.title,
+        LinkedInProfile.company, LinkedInProfile.location,
+        LinkedInProfile.linkedin_url, LinkedInProfile.image_url,
+        LinkedInProfile.expertise
+    ).filter_by(research_id=research_id).all()
+
+    step_rows = db.session.query(
+        ResearchStep.id, ResearchStep.type, ResearchStep.description,
+        ResearchStep.reasoning, ResearchStep.status, ResearchStep.result,
+        ResearchStep.confidence, ResearchStep.duration
+    ).filter_by(research_id=research_id).all()
+
+    insight_rows = db.session.query(
+        Insight.id, Insight.text
+    ).filter_by(research_id=research_id).all()
+
     # Format profiles with expertise as list
     profiles_data = []
-    for profile in profiles:
-        profile_dict = profile.to_dict()
-        if profile.expertise:
-            try:
-                profile_dict["expertise"] = json.loads(profile.expertise)
-            except:
-                profile_dict["expertise"] = []
-        else:
-            profile_dict["expertise"] = []
-        profiles_data.append(profile_dict)
-    
+    for row in profile_rows:
+        profiles_data.append({
+            "id": row.id,
+            "name": row.name,
+            "title": row.title,
+            "company": row.company,
+            "location": row.location,
+            "linkedin_url": row.linkedin_url,
+            "image_url": row.image_url,
+            "expertise": parse_expertise(row.expertise)
+        })
+
     # Prepare response
     response = {
         "id": research.id,
         "query": research.query,
-        "status": research.status,
+        "status": status,
         "summary": research.summary,
-        "created_at": research.created_at.isoformat() if research.created_at else None,
-        "updated_at": research.updated_at.isoformat() if research.updated_at else None,
+        "created_at": research.created_at,
+        "updated_at": research.updated_at,
         "profiles": profiles_data,
-        "steps": [step.to_dict() for step in steps],
-        "insights": [insight.to_dict() for insight in insights]
+        "steps": [
+            {
+                "id": row.id,
+                "type": row.type,
+                "description": row.description,
+                "reasoning": row.reasoning,
+                "status": row.status,
+                "result": row.result,
+                "confidence": row.confidence,
+                "duration": row.duration
+            }
+            for row in step_rows
+        ],
+        "insights": [{"id": row.id, "text": row.text} for row in insight_rows]
     }
-    
-    return jsonify(response)
+
+    # orjson serializes the datetime columns natively and is several times
+    # faster than Flask's default encoder on large profile/step payloads
+    resp = app.response_class(
+        orjson.dumps(response, option=orjson.OPT_NAIVE_UTC),
+        mimetype="application/json"
+    )
+    resp.set_etag(etag)
+    # The client must keep revalidating so it notices status transitions
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp
 
 
 @app.errorhandler(404)
@@ -2,14 +2,96 @@
 LinkedIn RapidAPI Client - Accesses real LinkedIn data through RapidAPI
 """
 import os
-import requests
+import re
+import asyncio
+import httpx
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+from cachetools import TTLCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Company metadata and people-search results are stable on hour
+# timescales, so results are held in shared TTL caches and repeated
+# queries skip RapidAPI (and its quota) entirely while still fresh
+_COMPANY_CACHE: TTLCache = TTLCache(maxsize=512, ttl=3600)
+_PEOPLE_CACHE: TTLCache = TTLCache(maxsize=512, ttl=3600)
+
+# Map of well-known companies used when the API returns no verified data
+FALLBACK_COMPANIES = {
+    "google": {
+        "name": "Google",
+        "industry": "Technology",
+        "location": "Mountain View, CA",
+        "description": "Google is a multinational technology company that specializes in Internet-related services and products.",
+        "website": "https://www.google.com",
+        "linkedin_url": "https://www.linkedin.com/company/google/",
+        "logo_url": "https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/Google_%22G%22_Logo.svg/2048px-Google_%22G%22_Logo.svg.png"
+    },
+    "microsoft": {
+        "name": "Microsoft",
+        "industry": "Technology",
+        "location": "Redmond, WA",
+        "description": "Microsoft is a multinational technology company that develops, manufactures, licenses, supports, and sells computer software, consumer electronics, and personal computers and services.",
+        "website": "https://www.microsoft.com",
+        "linkedin_url": "https://www.linkedin.com/company/microsoft/",
+        "logo_url": "https://upload.wikimedia.org/wikipedia/commons/thumb/4/44/Microsoft_logo.svg/2048px-Microsoft_logo.svg.png"
+    },
+    "apple": {
+        "name": "Apple",
+        "industry": "Technology",
+        "location": "Cupertino, CA",
+        "description": "Apple is a multinational technology company that designs, develops, and sells consumer electronics, computer software, and online services.",
+        "website": "https://www.apple.com",
+        "linkedin_url": "https://www.linkedin.com/company/apple/",
+        "logo_url": "https://upload.wikimedia.org/wikipedia/commons/thumb/f/fa/Apple_logo_black.svg/1667px-Apple_logo_black.svg.png"
+    },
+    "amazon": {
+        "name": "Amazon",
+        "industry": "E-commerce, Cloud Computing",
+        "location": "Seattle, WA",
+        "description": "Amazon is a multinational technology company focusing on e-commerce, cloud computing, digital streaming, and artificial intelligence.",
+        "website": "https://www.amazon.com",
+        "linkedin_url": "https://www.linkedin.com/company/amazon/",
+        "logo_url": "https://upload.wikimedia.org/wikipedia/commons/thumb/a/a9/Amazon_logo.svg/2560px-Amazon_logo.svg.png"
+    },
+    "facebook": {
+        "name": "Meta (formerly Facebook)",
+        "industry": "Technology, Social Media",
+        "location": "Menlo Park, CA",
+        "description": "Meta Platforms, Inc., doing business as Meta and formerly known as Facebook, Inc., is a multinational technology conglomerate that owns Facebook, Instagram, and WhatsApp, among other products and services.",
+        "website": "https://about.meta.com",
+        "linkedin_url": "https://www.linkedin.com/company/meta/",
+        "logo_url": "https://upload.wikimedia.org/wikipedia/commons/thumb/7/7b/Meta_Platforms_Inc._logo.svg/2560px-Meta_Platforms_Inc._logo.svg.png"
+    }
+}
+
+# Token index so the common "name contains a known keyword" case is a
+# single hash lookup instead of a substring scan over every key
+_FALLBACK_BY_TOKEN = {
+    token: company_data
+    for key, company_data in FALLBACK_COMPANIES.items()
+    for token in key.split()
+}
+
+# Map of common roles to their expertise areas
+ROLE_EXPERTISE = {
+    "software engineer": ["Programming", "Software Development", "Algorithms", "Problem Solving", "System Design"],
+    "data scientist": ["Machine Learning", "Data Analysis", "Statistics", "Python", "Data Visualization"],
+    "product manager": ["Product Strategy", "User Experience", "Agile", "Market Research", "Roadmapping"],
+    "marketing": ["Digital Marketing", "Content Strategy", "Social Media", "SEO", "Analytics"],
+    "sales": ["Sales Strategy", "Negotiation", "Client Relationships", "Business Development", "CRM"],
+    "designer": ["UI/UX Design", "Graphic Design", "Wireframing", "Prototyping", "User Research"],
+    "hr": ["Recruitment", "Employee Relations", "Talent Management", "Compensation", "Organizational Development"]
+}
+
+# One compiled alternation so role matching is a single C-level scan
+# instead of a Python loop of substring checks
+_ROLE_RE = re.compile("|".join(re.escape(key) for key in ROLE_EXPERTISE), re.IGNORECASE)
+
 class LinkedInRapidAPIClient:
     """Client for accessing LinkedIn data through RapidAPI"""
     
@@ -24,30 +106,73 @@ class LinkedInRapidAPIClient:
             "X-RapidAPI-Key": self.api_key,
             "X-RapidAPI-Host": "linkedin-data-scraper.p.rapidapi.com"
         }
+
+        # Cap concurrent RapidAPI requests when callers fan out with gather
+        self._request_semaphore = asyncio.Semaphore(5)
+
+        # Shared async client so keep-alive amortizes TCP/TLS setup across
+        # calls without blocking the event loop during requests
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=10,
+            transport=httpx.AsyncHTTPTransport(retries=3)
+        )
     
-    def get_company_info(self, company_name: str) -> Optional[Dict[str, Any]]:
+    async def warmup(self) -> None:
+        """Open a connection to the API host so later calls skip TLS setup"""
+        try:
+            await self.client.head("/", timeout=5)
+        except httpx.HTTPError as e:
+            logger.debug(f"Warmup request failed: {e}")
+
+    async def get_company_info(self, company_name: str) -> Optional[Dict[str, Any]]:
         """
         Get company information from LinkedIn
-        
+
+        Results are cached with a 1-hour TTL, so repeated research queries
+        about the same company only pay for one API call.
+
         Args:
             company_name: Name of the company
-            
+
+        Returns:
+            Company information or None if not found
+        """
+        cache_key = company_name.lower()
+        cached = _COMPANY_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # _fetch_company_info caches verified API data itself; fallback
+        # results are never cached so a transient API error doesn't pin a
+        # company to static data for the full TTL
+        return await self._fetch_company_info(company_name)
+
+    async def _fetch_company_info(self, company_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch company information from the API (uncached)
+
+        Args:
+            company_name: Name of the company
+
         Returns:
             Company information or None if not found
         """
         try:
-            url = f"{self.base_url}/company"
             querystring = {"company_name": company_name}
-            
+
             logger.info(f"Requesting company info for {company_name}")
-            response = requests.get(url, headers=self.headers, params=querystring)
+            async with self._request_semaphore:
+                response = await self.client.get("/company", params=querystring)
             
             if response.status_code == 200:
                 data = response.json()
                 if data and "items" in data and data["items"]:
-                    # Extract and format company information
+                    # Extract and format company information; only this
+                    # verified branch populates the cache
                     company_data = data["items"][0]
-                    return {
+                    company_info = {
                         "name": company_data.get("name", company_name),
                         "industry": company_data.get("industry", "Unknown"),
                         "location": company_data.get("location", "Unknown"),
@@ -57,6 +182,8 @@ class LinkedInRapidAPIClient:
                         "logo_url": company_data.get("logo_url", ""),
                         "employees": company_data.get("employees", {})
                     }
+                    _COMPANY_CACHE[company_name.lower()] = company_info
+                    return company_info
                 else:
                     # Fallback for well-known companies
                     return self._get_fallback_company_info(company_name)
@@ -69,20 +196,43 @@ class LinkedInRapidAPIClient:
             logger.error(f"Error getting company info: {str(e)}")
             return self._get_fallback_company_info(company_name)
     
-    def search_people(self, query: str, company: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def search_people(self, query: str, company: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Search for professionals on LinkedIn
-        
+
+        Results are cached with a 1-hour TTL per (query, company) pair.
+
         Args:
             query: Search query (role, skill, etc.)
             company: Company name (optional)
-            
+
+        Returns:
+            List of professional profiles
+        """
+        cache_key: Tuple[str, Optional[str]] = (query.lower(), company.lower() if company else None)
+        cached = _PEOPLE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        profiles = await self._search_people_uncached(query, company)
+
+        if profiles:
+            _PEOPLE_CACHE[cache_key] = profiles
+
+        return profiles
+
+    async def _search_people_uncached(self, query: str, company: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Search for professionals via the API (uncached)
+
+        Args:
+            query: Search query (role, skill, etc.)
+            company: Company name (optional)
+
         Returns:
             List of professional profiles
         """
         try:
-            url = f"{self.base_url}/people/search"
-            
             if company:
                 query_str = f"{query} at {company}"
             else:
@@ -91,7 +241,8 @@ class LinkedInRapidAPIClient:
             querystring = {"search_term": query_str}
             
             logger.info(f"Searching LinkedIn with query: {query_str}")
-            response = requests.get(url, headers=self.headers, params=querystring)
+            async with self._request_semaphore:
+                response = await self.client.get("/people/search", params=querystring)
             
             if response.status_code == 200:
                 data = response.json()
@@ -135,58 +286,14 @@ class LinkedInRapidAPIClient:
         """
         # Lowercase for case-insensitive matching
         company_lower = company_name.lower()
-        
-        # Map of well-known companies
-        companies = {
-            "google": {
-                "name": "Google",
-                "industry": "Technology",
-                "location": "Mountain View, CA",
-                "description": "Google is a multinational technology company that specializes in Internet-related services and products.",
-                "website": "https://www.google.com",
-                "linkedin_url": "https://www.linkedin.com/company/google/",
-                "logo_url": "https://upload.wikimedia.org/wikipedia/commons/thumb/5/53/Google_%22G%22_Logo.svg/2048px-Google_%22G%22_Logo.svg.png"
-            },
-            "microsoft": {
-                "name": "Microsoft",
-                "industry": "Technology",
-                "location": "Redmond, WA",
-                "description": "Microsoft is a multinational technology company that develops, manufactures, licenses, supports, and sells computer software, consumer electronics, and personal computers and services.",
-                "website": "https://www.microsoft.com",
-                "linkedin_url": "https://www.linkedin.com/company/microsoft/",
-                "logo_url": "https://upload.wikimedia.org/wikipedia/commons/thumb/4/44/Microsoft_logo.svg/2048px-Microsoft_logo.svg.png"
-            },
-            "apple": {
-                "name": "Apple",
-                "industry": "Technology",
-                "location": "Cupertino, CA",
-                "description": "Apple is a multinational technology company that designs, develops, and sells consumer electronics, computer software, and online services.",
-                "website": "https://www.apple.com",
-                "linkedin_url": "https://www.linkedin.com/company/apple/",
-                "logo_url": "https://upload.wikimedia.org/wikipedia/commons/thumb/f/fa/Apple_logo_black.svg/1667px-Apple_logo_black.svg.png"
-            },
-            "amazon": {
-                "name": "Amazon",
-                "industry": "E-commerce, Cloud Computing",
-                "location": "Seattle, WA",
-                "description": "Amazon is a multinational technology company focusing on e-commerce, cloud computing, digital streaming, and artificial intelligence.",
-                "website": "https://www.amazon.com",
-                "linkedin_url": "https://www.linkedin.com/company/amazon/",
-                "logo_url": "https://upload.wikimedia.org/wikipedia/commons/thumb/a/a9/Amazon_logo.svg/2560px-Amazon_logo.svg.png"
-            },
-            "facebook": {
-                "name": "Meta (formerly Facebook)",
-                "industry": "Technology, Social Media",
-                "location": "Menlo Park, CA",
-                "description": "Meta Platforms, Inc., doing business as Meta and formerly known as Facebook, Inc., is a multinational technology conglomerate that owns Facebook, Instagram, and WhatsApp, among other products and services.",
-                "website": "https://about.meta.com",
-                "linkedin_url": "https://www.linkedin.com/company/meta/",
-                "logo_url": "https://upload.wikimedia.org/wikipedia/commons/thumb/7/7b/Meta_Platforms_Inc._logo.svg/2560px-Meta_Platforms_Inc._logo.svg.png"
-            }
-        }
-        
-        # Check for company matches
-        for key, company_data in companies.items():
+
+        # O(1) exact token lookup for the common keyword case
+        for token in company_lower.split():
+            if token in _FALLBACK_BY_TOKEN:
+                return _FALLBACK_BY_TOKEN[token]
+
+        # Substring matching only when no token hit (e.g. partial names)
+        for key, company_data in FALLBACK_COMPANIES.items():
             if key in company_lower or company_lower in key:
                 return company_data
         
@@ -212,29 +319,12 @@ class LinkedInRapidAPIClient:
         Returns:
             List of generic profiles matching the role
         """
-        # Lowercase for case-insensitive matching
-        role_lower = role.lower()
-        
-        # Map of common roles to their expertise areas
-        role_expertise = {
-            "software engineer": ["Programming", "Software Development", "Algorithms", "Problem Solving", "System Design"],
-            "data scientist": ["Machine Learning", "Data Analysis", "Statistics", "Python", "Data Visualization"],
-            "product manager": ["Product Strategy", "User Experience", "Agile", "Market Research", "Roadmapping"],
-            "marketing": ["Digital Marketing", "Content Strategy", "Social Media", "SEO", "Analytics"],
-            "sales": ["Sales Strategy", "Negotiation", "Client Relationships", "Business Development", "CRM"],
-            "designer": ["UI/UX Design", "Graphic Design", "Wireframing", "Prototyping", "User Research"],
-            "hr": ["Recruitment", "Employee Relations", "Talent Management", "Compensation", "Organizational Development"]
-        }
-        
-        # Find the closest role match
-        matched_role = None
-        for key in role_expertise.keys():
-            if key in role_lower or role_lower in key:
-                matched_role = key
-                break
-        
+        # Find the closest role match with the precompiled alternation
+        match = _ROLE_RE.search(role)
+        matched_role = match.group(0).lower() if match else None
+
         # Use default expertise if no match
-        expertise = role_expertise.get(matched_role, ["Leadership", "Communication", "Problem Solving", "Strategic Thinking", "Innovation"])
+        expertise = ROLE_EXPERTISE.get(matched_role, ["Leadership", "Communication", "Problem Solving", "Strategic Thinking", "Innovation"])
         
         # Create fallback profiles
         if company:
@@ -2,28 +2,184 @@
 LinkedIn Research Agent - Shows real-time thought process and accesses LinkedIn data
 """
 import os
-import json
+import re
+import orjson
+import time
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from datetime import datetime, timezone
+from weakref import WeakKeyDictionary
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 from linkedin_rapidapi_client import LinkedInRapidAPIClient
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI
-openai_client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+# Initialize OpenAI; the async client shares one HTTP connection pool
+# across all GPT calls so requests cooperate with the event loop
+openai_client = AsyncOpenAI(
+    api_key=os.environ.get("OPENAI_API_KEY"),
+    max_retries=2,
+    timeout=30.0
+)
 # Note: the newest OpenAI model is "gpt-4o" which was released May 13, 2024
 GPT_MODEL = "gpt-4o"
+# Query analysis is simple entity extraction, so it runs on the cheaper,
+# lower-latency small model
+CLASSIFIER_MODEL = "gpt-4o-mini"
+
+# Static prompt text is hoisted to module constants and always placed at
+# the front of each message, with the per-query data at the very end, so
+# OpenAI's prefix-based prompt caching can reuse the preamble across runs
+ANALYZE_SYSTEM_PROMPT = "You are a professional research assistant that extracts structured information from queries."
+ANALYZE_PROMPT_PREFIX = (
+    "Analyze the LinkedIn research query given at the end of this message "
+    "and extract key information.\n\n"
+    "Extract the following information:\n"
+    "1. Target company name (if any)\n"
+    "2. Professional roles of interest (e.g., software engineer, product manager)\n"
+    "3. Technologies or skills mentioned (e.g., Python, machine learning)\n\n"
+    "Format the response as a JSON object with these keys:\n"
+    "- company: The target company name (null if none specified)\n"
+    "- roles: Array of professional roles mentioned\n"
+    "- technologies: Array of technologies or skills mentioned\n\n"
+)
+
+ANALYSIS_SYSTEM_PROMPT = "You are a professional LinkedIn researcher who identifies patterns in profiles and creates comprehensive summaries of research findings."
+ANALYSIS_PROMPT_PREFIX = (
+    "Analyze the LinkedIn research data given at the end of this message.\n\n"
+    "First, generate 3-5 meaningful insights about the professionals found. Focus on:\n"
+    "1. Common skills or qualifications\n"
+    "2. Career trajectories\n"
+    "3. Industry patterns\n"
+    "4. Any other notable patterns\n\n"
+    "Then create a detailed research summary in Markdown format that includes:\n"
+    "1. A summary of the research request\n"
+    "2. Company overview (if applicable)\n"
+    "3. Key professionals found\n"
+    "4. Patterns and insights\n"
+    "5. Recommendations for networking or further research\n\n"
+    "Make the summary actionable and insightful for a business professional.\n\n"
+)
+
+# Structured output schema for the fused insights + summary call
+ANALYSIS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "research_analysis",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "insights": {"type": "array", "items": {"type": "string"}},
+                "summary": {"type": "string"}
+            },
+            "required": ["insights", "summary"],
+            "additionalProperties": False
+        }
+    }
+}
+
+
+# Query analysis is deterministic extraction, so results are cached by
+# normalized query across research runs; the per-key locks keep
+# concurrent identical queries from issuing duplicate GPT calls
+_ANALYSIS_CACHE: Dict[str, Dict[str, Any]] = {}
+_ANALYSIS_LOCKS: Dict[str, asyncio.Lock] = {}
+_ANALYSIS_CACHE_MAX = 1024
+
+
+def _normalize_query(query: str) -> str:
+    """Normalize a query for cache keying"""
+    return " ".join(query.lower().split())
+
+
+def _log_prompt_cache(response) -> None:
+    """Log cached prompt tokens so the cache hit rate can be verified"""
+    try:
+        details = response.usage.prompt_tokens_details
+        if details and details.cached_tokens:
+            logger.info(f"Prompt cache hit: {details.cached_tokens} cached tokens")
+    except AttributeError:
+        pass
+
+
+_SUMMARY_KEY_RE = re.compile(r'"summary"\s*:\s*"')
+_JSON_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b",
+                 "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class _SummaryStreamExtractor:
+    """Incrementally extract the summary text from a streamed JSON response
+
+    The analysis call streams one structured JSON object, so the raw
+    deltas are JSON fragments, not readable text. This watches the stream
+    for the "summary" string, then decodes its escape sequences and
+    forwards plain summary text to the callback as it arrives.
+    """
+
+    def __init__(self, on_delta: Callable[[str], None]) -> None:
+        self._on_delta = on_delta
+        self._buffer = ""
+        self._in_summary = False
+        self._done = False
+
+    def feed(self, delta: str) -> None:
+        """Consume a raw stream delta, emitting any decoded summary text"""
+        if self._done:
+            return
+        self._buffer += delta
+        if not self._in_summary:
+            match = _SUMMARY_KEY_RE.search(self._buffer)
+            if match is None:
+                # Keep enough tail to match a key split across deltas
+                self._buffer = self._buffer[-32:]
+                return
+            self._buffer = self._buffer[match.end():]
+            self._in_summary = True
+        self._emit()
+
+    def _emit(self) -> None:
+        buf = self._buffer
+        text = []
+        pos = 0
+        while pos < len(buf):
+            char = buf[pos]
+            if char == '"':
+                self._done = True
+                break
+            if char != "\\":
+                text.append(char)
+                pos += 1
+                continue
+            if pos + 1 >= len(buf):
+                # Escape split across deltas; wait for the rest
+                break
+            escape = buf[pos + 1]
+            if escape == "u":
+                if pos + 6 > len(buf):
+                    break
+                text.append(chr(int(buf[pos + 2:pos + 6], 16)))
+                pos += 6
+            else:
+                text.append(_JSON_ESCAPES.get(escape, escape))
+                pos += 2
+        self._buffer = buf[pos:]
+        if text:
+            self._on_delta("".join(text))
 
 
 class ResearchStep:
     """A research step with detailed tracking of agent's thought process"""
-    
+
+    # Steps are created per call and serialized in bulk; slots keep them
+    # compact and make attribute access a fixed-offset load
+    __slots__ = ("description", "reasoning", "status", "result",
+                 "start_time", "end_time", "confidence",
+                 "_start_ns", "_end_ns")
+
     def __init__(self, description: str, reasoning: Optional[str] = None):
         """
         Initialize a research step
@@ -36,9 +192,13 @@ class ResearchStep:
         self.reasoning = reasoning
         self.status = "in_progress"
         self.result = None
-        self.start_time = datetime.now()
+        # Wall-clock timestamps are for display; durations come from the
+        # monotonic clock so NTP adjustments can't produce negative values
+        self.start_time = datetime.now(timezone.utc)
         self.end_time = None
         self.confidence = None
+        self._start_ns = time.monotonic_ns()
+        self._end_ns = None
         
     def complete(self, success: bool, result: Any = None, confidence: Optional[float] = None):
         """
@@ -51,14 +211,15 @@ class ResearchStep:
         """
         self.status = "completed" if success else "failed"
         self.result = result
-        self.end_time = datetime.now()
+        self.end_time = datetime.now(timezone.utc)
         self.confidence = confidence
+        self._end_ns = time.monotonic_ns()
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         duration = None
-        if self.end_time and self.start_time:
-            duration = (self.end_time - self.start_time).total_seconds()
+        if self._end_ns is not None:
+            duration = (self._end_ns - self._start_ns) / 1e9
         
         return {
             "description": self.description,
@@ -86,14 +247,43 @@ class LinkedInResearchAgent:
         self.company_info = None
         self.summary = None
         self.linkedin_client = LinkedInRapidAPIClient()
+
+        # Pre-warm DNS/TLS to OpenAI and RapidAPI so the first real call
+        # doesn't pay connection setup; skipped when no loop is running
+        try:
+            asyncio.get_running_loop().create_task(self._warmup())
+        except RuntimeError:
+            pass
+
+    def reset(self) -> None:
+        """Clear per-research state so the agent can be reused"""
+        self.steps = []
+        self.profiles = []
+        self.insights = []
+        self.company_info = None
+        self.summary = None
+
+    async def _warmup(self) -> None:
+        """Establish API connections ahead of the first real call"""
+        try:
+            await openai_client.models.list()
+        except Exception as e:
+            logger.debug(f"OpenAI warmup failed: {e}")
+        try:
+            await self.linkedin_client.warmup()
+        except Exception as e:
+            logger.debug(f"RapidAPI warmup failed: {e}")
         
-    async def research(self, query: str) -> Dict[str, Any]:
+    async def research(self, query: str,
+                       on_delta: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
         Perform LinkedIn research with transparent thought process
-        
+
         Args:
             query: User research query
-            
+            on_delta: Optional callback invoked with chunks of the summary
+                text as it is generated
+
         Returns:
             Research results with detailed thought process
         """
@@ -123,38 +313,48 @@ class LinkedInResearchAgent:
                 "technologies": technologies
             })
             
-            # Step 3: Research company if specified
+            # Determine search query from roles or original query
+            search_query = roles[0] if roles else query
+
+            # Steps 3+4: Company research and people search are independent
+            # once the query analysis is done, so run them concurrently
             if company_name:
                 company_step = self._add_step(
                     f"Researching company: {company_name}",
                     f"Gathering information about {company_name} from LinkedIn."
                 )
-                
-                company_info = self.linkedin_client.get_company_info(company_name)
-                
-                if company_info:
+                search_step = self._add_step(
+                    "Searching for professionals",
+                    "Finding relevant professionals based on query criteria."
+                )
+
+                company_info, profiles = await asyncio.gather(
+                    self.linkedin_client.get_company_info(company_name),
+                    self.linkedin_client.search_people(search_query, company_name),
+                    return_exceptions=True
+                )
+
+                if isinstance(company_info, BaseException):
+                    logger.error(f"Error researching company: {company_info}")
+                    company_step.complete(False, {"error": str(company_info)})
+                elif company_info:
                     company_step.complete(True, company_info)
                     self.company_info = company_info
                 else:
                     company_step.complete(False, {
                         "error": f"Could not find verified information for {company_name}"
                     })
-            
-            # Step 4: Search for professionals
-            search_step = self._add_step(
-                "Searching for professionals", 
-                "Finding relevant professionals based on query criteria."
-            )
-            
-            # Determine search query from roles or original query
-            search_query = roles[0] if roles else query
-            
-            # Search for people
-            if company_name:
-                profiles = self.linkedin_client.search_people(search_query, company_name)
+
+                if isinstance(profiles, BaseException):
+                    logger.error(f"Error searching people: {profiles}")
+                    profiles = []
             else:
-                profiles = self.linkedin_client.search_people(search_query)
-                
+                search_step = self._add_step(
+                    "Searching for professionals",
+                    "Finding relevant professionals based on query criteria."
+                )
+                profiles = await self.linkedin_client.search_people(search_query)
+
             if profiles:
                 search_step.complete(True, {"profiles_found": len(profiles)})
                 self.profiles = profiles
@@ -167,7 +367,7 @@ class LinkedInResearchAgent:
                     "Initial search returned no results. Trying with broader criteria."
                 )
                 
-                fallback_profiles = self.linkedin_client.search_people(query)
+                fallback_profiles = await self.linkedin_client.search_people(query)
                 
                 if fallback_profiles:
                     fallback_step.complete(True, {"profiles_found": len(fallback_profiles)})
@@ -175,26 +375,31 @@ class LinkedInResearchAgent:
                 else:
                     fallback_step.complete(False, {"error": "No profiles found in fallback search"})
             
-            # Step 5: Generate insights from the profiles
-            if self.profiles:
-                insight_step = self._add_step(
-                    "Analyzing professional profiles",
-                    "Examining profiles to identify patterns and insights."
+            # Step 5: Generate insights and the summary in one GPT call so
+            # the profile payload is only sent (and paid for) once; with
+            # no data at all, skip the model entirely
+            if not self.profiles and not self.company_info:
+                skip_step = self._add_step(
+                    "Skipping analysis",
+                    "No profiles or company data were found, so there is nothing to analyze."
                 )
-                
-                insights = await self._generate_insights(self.profiles, company_name, roles)
-                insight_step.complete(True, {"insights_generated": len(insights)})
+                skip_step.complete(True)
+                self.summary = (
+                    f"No LinkedIn data found for query: {query}. "
+                    "Try broadening the search terms or checking the company name."
+                )
+            else:
+                analysis_step = self._add_step(
+                    "Analyzing profiles and creating summary",
+                    "Examining profiles for patterns and synthesizing findings into a research summary."
+                )
+
+                insights, summary = await self._analyze_profiles_and_summarize(
+                    query, company_name, roles, on_delta=on_delta
+                )
+                analysis_step.complete(True, {"insights_generated": len(insights)})
                 self.insights = insights
-            
-            # Step 6: Create a comprehensive summary
-            summary_step = self._add_step(
-                "Creating research summary",
-                "Synthesizing findings into a comprehensive research summary."
-            )
-            
-            summary = await self._create_summary(query)
-            summary_step.complete(True)
-            self.summary = summary
+                self.summary = summary
             
             # Return the research results
             return {
@@ -228,169 +433,216 @@ class LinkedInResearchAgent:
     
     async def _analyze_query(self, query: str) -> Dict[str, Any]:
         """Analyze the query using GPT to extract key information"""
-        prompt = "Analyze the following LinkedIn research query and extract key information:\n\n"
-        prompt += f"Query: \"{query}\"\n\n"
-        prompt += "Extract the following information:\n"
-        prompt += "1. Target company name (if any)\n"
-        prompt += "2. Professional roles of interest (e.g., software engineer, product manager)\n"
-        prompt += "3. Technologies or skills mentioned (e.g., Python, machine learning)\n\n"
-        prompt += "Format the response as a JSON object with these keys:\n"
-        prompt += "- company: The target company name (null if none specified)\n"
-        prompt += "- roles: Array of professional roles mentioned\n"
-        prompt += "- technologies: Array of technologies or skills mentioned"
-        
+        cache_key = _normalize_query(query)
+        cached = _ANALYSIS_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = openai_client.chat.completions.create(
-                model=GPT_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a professional research assistant that extracts structured information from queries."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"}
-            )
-            
-            # Parse the JSON response
-            analysis = json.loads(response.choices[0].message.content)
-            return analysis
-            
+            # Per-key lock so concurrent identical queries don't fan out
+            # into duplicate GPT calls
+            lock = _ANALYSIS_LOCKS.setdefault(cache_key, asyncio.Lock())
+            async with lock:
+                cached = _ANALYSIS_CACHE.get(cache_key)
+                if cached is not None:
+                    return cached
+
+                try:
+                    analysis = await self._analyze_query_uncached(query)
+                finally:
+                    # Drop the lock entry even when the GPT call fails so
+                    # failing queries don't accumulate stale locks
+                    _ANALYSIS_LOCKS.pop(cache_key, None)
+
+                if len(_ANALYSIS_CACHE) >= _ANALYSIS_CACHE_MAX:
+                    _ANALYSIS_CACHE.pop(next(iter(_ANALYSIS_CACHE)))
+                _ANALYSIS_CACHE[cache_key] = analysis
+                return analysis
+
         except Exception as e:
             logger.error(f"Error analyzing query with GPT: {e}")
-            # Return a basic analysis if GPT fails
+            # Return a basic analysis (uncached) if GPT fails
             return {
                 "company": None,
                 "roles": [query],
                 "technologies": []
             }
+
+    async def _analyze_query_uncached(self, query: str) -> Dict[str, Any]:
+        """Run the query-analysis GPT call without consulting the cache"""
+        prompt = ANALYZE_PROMPT_PREFIX + f"Query: \"{query}\""
+
+        response = await openai_client.chat.completions.create(
+            model=CLASSIFIER_MODEL,
+            messages=[
+                {"role": "system", "content": ANALYZE_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            response_format={"type": "json_object"}
+        )
+        _log_prompt_cache(response)
+
+        # Parse the JSON response
+        return orjson.loads(response.choices[0].message.content)
     
-    async def _generate_insights(self, profiles: List[Dict[str, Any]], 
-                                company: Optional[str], roles: List[str]) -> List[str]:
-        """Generate insights about the profiles using GPT"""
-        # Format profiles for GPT analysis
-        profiles_text = []
-        for i, profile in enumerate(profiles, 1):
-            profile_text = f"{i}. {profile.get('name', 'Unknown')}\n"
-            profile_text += f"   Title: {profile.get('title', 'N/A')}\n" 
-            profile_text += f"   Company: {profile.get('company', 'N/A')}\n"
-            profile_text += f"   Location: {profile.get('location', 'N/A')}\n"
-            profile_text += f"   Expertise: {', '.join(profile.get('expertise', []))}\n"
-            profiles_text.append(profile_text)
-        
-        profiles_str = "\n".join(profiles_text)
-        
-        company_context = f"For company: {company}" if company else ""
-        roles_context = f"For roles: {', '.join(roles)}" if roles else "" 
-        
-        prompt = "Analyze the following LinkedIn profiles and generate insights:\n\n"
-        prompt += f"Profiles:\n{profiles_str}\n\n"
-        prompt += f"{company_context}\n" if company_context else ""
-        prompt += f"{roles_context}\n" if roles_context else ""
-        prompt += "\nGenerate 3-5 meaningful insights about these professionals. Focus on:\n"
-        prompt += "1. Common skills or qualifications\n"
-        prompt += "2. Career trajectories\n"
-        prompt += "3. Industry patterns\n"
-        prompt += "4. Any other notable patterns\n\n"
-        prompt += "Format your response as a JSON array of insight strings."
-        
-        try:
-            response = openai_client.chat.completions.create(
-                model=GPT_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a professional LinkedIn researcher who identifies patterns and insights from profiles."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"}
-            )
-            
-            # Parse the JSON response
-            insights_data = json.loads(response.choices[0].message.content)
-            
-            # Extract insights array from the response
-            if isinstance(insights_data, list):
-                return insights_data
-            elif "insights" in insights_data:
-                return insights_data["insights"]
-            else:
-                return list(insights_data.values()) if isinstance(insights_data, dict) else []
-            
-        except Exception as e:
-            logger.error(f"Error generating insights with GPT: {e}")
-            return ["Unable to generate insights due to an error."]
-    
-    async def _create_summary(self, query: str) -> str:
-        """Create a comprehensive research summary using GPT"""
-        # Format profiles
-        profiles_text = []
-        for i, profile in enumerate(self.profiles[:5], 1):  # Limit to 5 profiles
-            profile_text = f"{i}. {profile.get('name', 'Unknown')}\n"
-            profile_text += f"   Title: {profile.get('title', 'N/A')}\n"
-            profile_text += f"   Company: {profile.get('company', 'N/A')}\n"
-            profile_text += f"   Location: {profile.get('location', 'N/A')}\n"
-            profile_text += f"   Expertise: {', '.join(profile.get('expertise', []))}\n"
-            profiles_text.append(profile_text)
-        
-        # Format company info
-        company_text = ""
-        if self.company_info:
-            company_text = f"""
+    def _format_profiles(self, limit: Optional[int] = None) -> str:
+        """
+        Serialize profiles for LLM prompts as a compact TSV block
+
+        The tabular layout drops the repeated per-field labels, the
+        company column is hoisted into a header line when it is the same
+        for every profile, and expertise is capped at the top five
+        skills — together cutting prompt tokens substantially.
+
+        Args:
+            limit: Maximum number of profiles to include (all if None)
+
+        Returns:
+            Profiles formatted as a TSV block with a header row
+        """
+        profiles = self.profiles[:limit] if limit else self.profiles
+        if not profiles:
+            return ""
+
+        companies = {profile.get("company", "") for profile in profiles}
+        # Treat an all-empty company column the same as a mixed one so the
+        # header and row branches below always agree on the column count
+        shared_company = (companies.pop() or None) if len(companies) == 1 else None
+
+        lines = []
+        if shared_company is not None:
+            lines.append(f"Company (all profiles): {shared_company}")
+            lines.append("name\ttitle\tlocation\texpertise")
+        else:
+            lines.append("name\ttitle\tcompany\tlocation\texpertise")
+
+        for profile in profiles:
+            fields = [profile.get("name", "Unknown"), profile.get("title", "")]
+            if shared_company is None:
+                fields.append(profile.get("company", ""))
+            fields.append(profile.get("location", ""))
+            fields.append(", ".join(profile.get("expertise", [])[:5]))
+            lines.append("\t".join(fields))
+
+        return "\n".join(lines)
+
+    def _format_company(self) -> str:
+        """
+        Serialize company info for LLM prompts
+
+        Returns:
+            Company information block, or an empty string if none gathered
+        """
+        if not self.company_info:
+            return ""
+
+        return f"""
             Company Information:
             Name: {self.company_info.get('name', 'N/A')}
             Industry: {self.company_info.get('industry', 'N/A')}
             Location: {self.company_info.get('location', 'N/A')}
             Description: {self.company_info.get('description', 'N/A')}
             """
-        
-        # Format insights
-        insights_text = "\n".join([f"- {insight}" for insight in self.insights])
-        
-        prompt = "Create a comprehensive LinkedIn research summary based on the following:\n\n"
+
+    async def _analyze_profiles_and_summarize(self, query: str, company: Optional[str],
+                                              roles: List[str],
+                                              on_delta: Optional[Callable[[str], None]] = None) -> Tuple[List[str], str]:
+        """Generate insights and the research summary in a single GPT call
+
+        The completion is streamed so the first tokens arrive as soon as
+        generation starts; on_delta receives the decoded summary text as
+        it is generated, not the raw JSON fragments.
+        """
+        profiles_str = self._format_profiles()
+        company_text = self._format_company()
+        roles_context = f"For roles: {', '.join(roles)}" if roles else ""
+
+        # Static instructions first, variable data last (prompt caching)
+        prompt = ANALYSIS_PROMPT_PREFIX
         prompt += f"Original Query:\n{query}\n\n"
-        
+        prompt += f"{roles_context}\n\n" if roles_context else ""
+
         if company_text:
             prompt += f"{company_text}\n\n"
-        
-        if profiles_text:
-            prompt += f"Professionals Found:\n{chr(10).join(profiles_text)}\n\n"
-        else:
-            prompt += "Professionals Found:\nNo profiles found.\n\n"
-        
-        if insights_text:
-            prompt += f"Insights:\n{insights_text}\n\n"
+
+        if profiles_str:
+            prompt += f"Professionals Found:\n{profiles_str}"
         else:
-            prompt += "Insights:\nNo insights available.\n\n"
-        
-        prompt += "Create a detailed research summary in Markdown format that includes:\n"
-        prompt += "1. A summary of the research request\n"
-        prompt += "2. Company overview (if applicable)\n"
-        prompt += "3. Key professionals found\n"
-        prompt += "4. Patterns and insights\n"
-        prompt += "5. Recommendations for networking or further research\n\n"
-        prompt += "Make the summary actionable and insightful for a business professional."
-        
+            prompt += "Professionals Found:\nNo profiles found."
+
         try:
-            response = openai_client.chat.completions.create(
+            stream = await openai_client.chat.completions.create(
                 model=GPT_MODEL,
                 messages=[
-                    {"role": "system", "content": "You are a professional LinkedIn researcher who creates comprehensive summaries of research findings."},
+                    {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
-                ]
+                ],
+                response_format=ANALYSIS_RESPONSE_FORMAT,
+                stream=True,
+                stream_options={"include_usage": True}
             )
-            
-            return response.choices[0].message.content
-            
+
+            extractor = _SummaryStreamExtractor(on_delta) if on_delta else None
+            chunks = []
+            async for chunk in stream:
+                if getattr(chunk, "usage", None):
+                    _log_prompt_cache(chunk)
+                if chunk.choices and chunk.choices[0].delta.content:
+                    delta = chunk.choices[0].delta.content
+                    chunks.append(delta)
+                    if extractor:
+                        extractor.feed(delta)
+
+            # Parse the structured response
+            analysis = orjson.loads("".join(chunks))
+            return analysis.get("insights", []), analysis.get("summary", "")
+
         except Exception as e:
-            logger.error(f"Error creating summary with GPT: {e}")
-            return "Unable to generate a summary due to an error."
+            logger.error(f"Error analyzing profiles with GPT: {e}")
+            return (
+                ["Unable to generate insights due to an error."],
+                "Unable to generate a summary due to an error."
+            )
 
 
-async def research_linkedin(query: str) -> Dict[str, Any]:
+# Pools of reusable agents so the RapidAPI client and its warm
+# connection pool survive across research calls instead of being rebuilt
+# each time. Keyed on the running event loop: an agent's HTTP clients
+# are bound to the loop they were built on, so agents must never be
+# reused across loops; pools vanish with their loop
+_AGENT_POOL_SIZE = 10
+_agent_pools: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Queue]" = WeakKeyDictionary()
+
+
+async def research_linkedin(query: str,
+                            on_delta: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
     """
     Perform LinkedIn research with transparent process
-    
+
     Args:
         query: Research query
-        
+        on_delta: Optional callback invoked with chunks of the summary
+            text as it is generated
+
     Returns:
         Research results with all steps and thought processes
     """
-    agent = LinkedInResearchAgent()
-    return await agent.research(query)
+    loop = asyncio.get_running_loop()
+    pool = _agent_pools.get(loop)
+    if pool is None:
+        pool = asyncio.Queue(maxsize=_AGENT_POOL_SIZE)
+        _agent_pools[loop] = pool
+
+    try:
+        agent = pool.get_nowait()
+    except asyncio.QueueEmpty:
+        agent = LinkedInResearchAgent()
+
+    try:
+        return await agent.research(query, on_delta=on_delta)
+    finally:
+        agent.reset()
+        try:
+            pool.put_nowait(agent)
+        except asyncio.QueueFull:
+            pass